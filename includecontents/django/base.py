@@ -41,6 +41,7 @@ class Template(django.template.base.Template):
 tag_re = re.compile(
     r"({%.*?%}|{{.*?}}|{#.*?#}|</?include:(?:\"[^\"]*\"|'[^']*'|.)*?>)", re.DOTALL
 )
+braced_attr_re = re.compile(r"([-:.\w]+)=\{(.+)\}")
 
 
 class Lexer(django.template.base.Lexer):
@@ -84,7 +85,7 @@ class Lexer(django.template.base.Lexer):
             tag_name = bits.pop(0)
             attrs = []
             for attr in bits:
-                if group := re.match(r"([-:.\w]+)=\{(.+)\}", attr):
+                if "={" in attr and (group := braced_attr_re.match(attr)):
                     attr = f"{group[1]}={group[2]}"
                 attrs.append(attr)
             # Build the includecontents tag
@@ -139,5 +140,5 @@ class TagsDict(dict):
 
     def __getitem__(self, key):
         if isinstance(key, str) and "." in key:
-            key = key.split(".", maxsplit=1)[0]
+            key = key.partition(".")[0]
         return super().__getitem__(key)
@@ -2,6 +2,7 @@ import re
 from collections import abc
 from collections.abc import MutableMapping
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import Any
 
 from django import template
@@ -18,6 +19,12 @@ from includecontents.django.base import Template
 register = template.Library()
 
 re_camel_case = re.compile(r"(?<=.)([A-Z])")
+re_template_var = re.compile(r"(['\"]?)\{\{ *(.*?) *\}\}\1")
+re_nested_attr = re.compile(r"(^\w+[.:][-.\w:]+)(?:=(.+))?$")
+re_shorthand_attr = re.compile(r"^{ *(\w+) *}$")
+re_old_style_attr = re.compile(r"^(\w+)={(\w+)}$")
+re_prop = re.compile(r"^(\w+)(?:=(.+?))?,?$")
+re_attrs_fallback = re.compile(r"^(\w+(?::[-\w]+)?)(?:=(.+?))?$")
 
 
 @register.tag
@@ -64,7 +71,8 @@ def includecontents(parser, token):
         </div>
     """
     # Remove template {{ }}.
-    token.contents = re.sub(r"(['\"]?)\{\{ *(.*?) *\}\}\1", r"\2", token.contents)
+    if "{{" in token.contents:
+        token.contents = re_template_var.sub(r"\2", token.contents)
     bits = token.split_contents()
     # If this was an HTML tag, it's second element is the tag name prefixed with an
     # underscore (and ending with a slash if it's self-closing).
@@ -81,7 +89,7 @@ def includecontents(parser, token):
         for i, bit in enumerate(bits):
             if i < 3:
                 new_bits.append(bit)
-            elif match := re.match(r"(^\w+[.:][-.\w:]+)(?:=(.+))?$", bit):
+            elif match := re_nested_attr.match(bit):
                 # Nested attrs can't be handled by the standard include tag.
                 attr, value = match.groups()
                 advanced_attrs[attr] = parser.compile_filter(value or "True")
@@ -92,11 +100,11 @@ def includecontents(parser, token):
                 else:
                     attr, value = bit, ""
                 advanced_attrs[attr] = parser.compile_filter(value or "True")
-            elif match := re.match(r"^{ *(\w+) *}$", bit):
+            elif bit.startswith("{") and (match := re_shorthand_attr.match(bit)):
                 # Shorthand, e.g. {attr} is equivalent to attr=attr.
                 attr = match.group(1)
                 advanced_attrs[attr] = parser.compile_filter(attr)
-            elif match := re.match(r"^(\w+)={(\w+)}$", bit):
+            elif "={" in bit and (match := re_old_style_attr.match(bit)):
                 # Old style template variable syntax: title={myTitle}
                 attr, var = match.groups()
                 advanced_attrs[attr] = parser.compile_filter(var)
@@ -217,23 +225,21 @@ class IncludeContentsNode(template.Node):
             return
         template = self.get_component_template(context)
         component_props = self.get_component_props(template)
-        if component_props is not None:
-            undefined_attrs = Attrs()
-        for key, value in self.all_attrs():
-            if component_props is None:
+        if component_props is None:
+            for key, value in self.all_attrs():
                 if "." in key or ":" in key:
                     raise TemplateSyntaxError(
                         f"Advanced attribute {key!r} only allowed if component template"
                         " defines props"
                     )
                 new_context[key] = value.resolve(context)
-            else:
+        else:
+            undefined_attrs = Attrs()
+            for key, value in self.all_attrs():
                 if key in component_props:
                     new_context[key] = value.resolve(context)
                 else:
                     undefined_attrs[key] = value.resolve(context)
-
-        if component_props is not None:
             new_context["attrs"] = undefined_attrs
 
             # Put default values in the new context.
@@ -257,35 +263,19 @@ class IncludeContentsNode(template.Node):
             yield key, value
 
     def get_component_props(self, template):
-        if not template.first_comment:
+        props = parse_component_props(template.first_comment)
+        if props is None:
             return None
-        if (
-            template.first_comment.startswith("props ")
-            or template.first_comment == "props"
-        ):
-            first_comment = template.first_comment[6:]
-        elif (
-            template.first_comment.startswith("def ") or template.first_comment == "def"
-        ):
-            first_comment = template.first_comment[4:]
-        else:
-            return None
-        props = {}
-        for bit in smart_split(first_comment.strip()):
-            if match := re.match(r"^(\w+)(?:=(.+?))?,?$", bit):
-                attr, value = match.groups()
-                if value is None:
-                    # Check both extra_context and advanced_attrs for required attributes
-                    if (
-                        attr not in self.include_node.extra_context
-                        and attr not in self.advanced_attrs
-                    ):
-                        raise TemplateSyntaxError(
-                            f'Missing required attribute "{attr}" in {self.token_name}'
-                        )
-                    props[attr] = None
-                else:
-                    props[attr] = Variable(value)
+        for attr, value in props.items():
+            # Check both extra_context and advanced_attrs for required attributes
+            if (
+                value is None
+                and attr not in self.include_node.extra_context
+                and attr not in self.advanced_attrs
+            ):
+                raise TemplateSyntaxError(
+                    f'Missing required attribute "{attr}" in {self.token_name}'
+                )
         return props
 
     def get_component_template(self, context) -> Template:
@@ -360,24 +350,62 @@ def get_contents_nodelists(
     raise Exception
 
 
+@lru_cache(maxsize=None)
+def parse_component_props(first_comment):
+    """
+    Parse the props definition from a component template's first comment.
+
+    Returns ``None`` if the comment isn't a props definition. Otherwise returns a
+    dictionary of prop names to their default ``Variable`` (or ``None`` for
+    required props).
+
+    The result is cached by comment contents so that components aren't reparsed on
+    every render, so don't mutate the returned dictionary.
+    """
+    if not first_comment:
+        return None
+    keyword, _, first_comment = first_comment.partition(" ")
+    if keyword not in ("props", "def"):
+        return None
+    props = {}
+    for bit in smart_split(first_comment.strip()):
+        if match := re_prop.match(bit):
+            attr, value = match.groups()
+            props[attr] = None if value is None else Variable(value)
+    return props
+
+
+@lru_cache
+def camel_to_kebab(key: str) -> str:
+    """
+    Convert a camelCase attribute name to kebab-case, e.g. ``xData`` to ``x-data``.
+    """
+    return re_camel_case.sub(r"-\1", key).lower()
+
+
 NO_VALUE = object()
+MISSING = object()
 
 
 class Attrs(MutableMapping):
+    __slots__ = ("_attrs", "_nested_attrs", "_extended")
+
     def __init__(self):
         self._attrs: dict[str, Any] = {}
         self._nested_attrs: dict[str, Attrs] = {}
         self._extended: dict[str, dict[str, bool]] = {}
 
     def __getattr__(self, key):
-        if key not in self._nested_attrs:
+        nested_attrs = self._nested_attrs.get(key)
+        if nested_attrs is None:
             raise AttributeError(key)
-        return self._nested_attrs[key]
+        return nested_attrs
 
     def __getitem__(self, key):
-        if key not in self._attrs:
-            key = re_camel_case.sub(r"-\1", key).lower()
-        return self._attrs[key]
+        value = self._attrs.get(key, MISSING)
+        if value is MISSING:
+            value = self._attrs[camel_to_kebab(key)]
+        return value
 
     def __setitem__(self, key, value):
         if "." in key:
@@ -473,7 +501,7 @@ def attrs(parser: Parser, token):
 
     fallbacks = {}
     for bit in bits:
-        match = re.match(r"^(\w+(?::[-\w]+)?)(?:=(.+?))?$", bit)
+        match = re_attrs_fallback.match(bit)
         if not match:
             raise TemplateSyntaxError(f"Invalid {tag_name!r} tag attribute: {bit!r}")
         key, value = match.groups()
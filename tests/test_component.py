@@ -251,3 +251,13 @@ def test_new_attr_syntax():
 </main>
 """
     )
+
+
+def test_cached_props_still_check_required_attrs():
+    output = Template("""<include:card title="hello" />""").render(Context())
+    assert "<h3 >hello</h3>" in output
+    with pytest.raises(
+        TemplateSyntaxError,
+        match='Missing required attribute "title" in <include:card/>',
+    ):
+        Template("""<include:card />""").render(Context())
@@ -43,6 +43,13 @@ def test_attrs_class():
     assert attrs["MeOut"] == 2
 
 
+def test_attrs_slots():
+    attrs = Attrs()
+    assert not hasattr(attrs, "__dict__")
+    with pytest.raises(AttributeError):
+        attrs.unknown = 1
+
+
 def test_context():
     assert render_to_string("test_tag/basic.html", {"id": "seen"}) == (
         """<div class="outer">